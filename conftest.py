@@ -0,0 +1,9 @@
+import os
+import tempfile
+
+# Keep test runs out of the real execution history database; this must be set
+# before src.exec_tools.ExecutionHistoryStore is first imported
+os.environ.setdefault(
+    'EXECUTION_HISTORY_DB',
+    os.path.join(tempfile.mkdtemp(prefix='execution_history_'), 'execution_history.db')
+)
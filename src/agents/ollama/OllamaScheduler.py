@@ -0,0 +1,145 @@
+import itertools
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+import litellm
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+class OllamaScheduler:
+    """
+    Schedule LLM calls against a single local Ollama instance.
+
+    Calls from every session share a bounded number of concurrency slots and
+    wait in a first-come, first-served queue, so a burst of requests queues up
+    instead of making Ollama thrash. Every call carries the same context
+    window, since Ollama reloads a model whenever num_ctx changes, and a
+    keep-alive hint so the model stays resident between calls.
+    """
+
+    def __init__(self, max_concurrent=None, queue_timeout=None):
+        """
+        Args:
+            max_concurrent (int, optional): Maximum number of calls sent to Ollama at once
+            queue_timeout (float, optional): Seconds a call may wait for a slot
+        """
+        self.max_concurrent = max_concurrent if max_concurrent is not None else int(os.getenv('OLLAMA_MAX_CONCURRENT', 1))
+        self.queue_timeout = queue_timeout if queue_timeout is not None else float(os.getenv('OLLAMA_QUEUE_TIMEOUT', 300))
+        self.num_ctx = int(os.getenv('OLLAMA_NUM_CTX', 8192))
+        self.keep_alive = os.getenv('OLLAMA_KEEP_ALIVE', '30m').strip()
+
+        self._condition = threading.Condition()
+        self._waiting = deque()
+        self._sequence = itertools.count()
+        self._active = 0
+        self._stats = {'completed': 0, 'failed': 0, 'timed_out': 0, 'queue_wait_seconds': 0.0}
+        self._calls_by_model = {}
+
+    @staticmethod
+    def litellm_model(model):
+        """
+        Send 'ollama/' models through LiteLLM's Ollama chat provider, which
+        passes keep_alive to Ollama as a top-level field; the 'ollama/'
+        provider nests it in options, where Ollama ignores it.
+        """
+        if model.startswith('ollama/'):
+            return 'ollama_chat/' + model[len('ollama/'):]
+        return model
+
+    @contextmanager
+    def slot(self):
+        """
+        Wait for a concurrency slot, serving calls in the order they arrived.
+
+        Raises:
+            TimeoutError: If no slot became free within queue_timeout seconds
+        """
+        ticket = next(self._sequence)
+        enqueued_at = time.monotonic()
+        deadline = enqueued_at + self.queue_timeout
+
+        with self._condition:
+            self._waiting.append(ticket)
+            while self._waiting[0] != ticket or self._active >= self.max_concurrent:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._waiting.remove(ticket)
+                    self._stats['timed_out'] += 1
+                    self._condition.notify_all()
+                    raise TimeoutError(f"No Ollama slot became available within {self.queue_timeout} seconds")
+                self._condition.wait(remaining)
+
+            self._waiting.popleft()
+            self._active += 1
+            self._stats['queue_wait_seconds'] += time.monotonic() - enqueued_at
+            # The next waiter may be able to start as well
+            self._condition.notify_all()
+
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._active -= 1
+                self._condition.notify_all()
+
+    def complete(self, prompt, model, api_base=None, temperature=None, stop=None):
+        """
+        Run a completion through the scheduler.
+
+        Args:
+            prompt (str): Prompt to send
+            model (str): LiteLLM model name, e.g. 'ollama/llama3'
+            api_base (str, optional): Ollama base URL
+            temperature (float, optional): Sampling temperature
+            stop (list, optional): Stop sequences
+
+        Returns:
+            str: Content of the model's reply
+        """
+        with self.slot():
+            try:
+                response = litellm.completion(
+                    model=self.litellm_model(model),
+                    messages=[{"role": "user", "content": prompt}],
+                    temperature=temperature,
+                    stop=stop,
+                    api_base=api_base,
+                    num_ctx=self.num_ctx,
+                    keep_alive=self.keep_alive
+                )
+            except Exception:
+                with self._condition:
+                    self._stats['failed'] += 1
+                raise
+
+        with self._condition:
+            self._stats['completed'] += 1
+            self._calls_by_model[model] = self._calls_by_model.get(model, 0) + 1
+        return response.choices[0].message.content
+
+    def report(self):
+        """
+        Summarize scheduler activity.
+
+        Returns:
+            dict: Active and waiting calls, counters and calls per model
+        """
+        with self._condition:
+            started = self._stats['completed'] + self._stats['failed']
+            return {
+                **self._stats,
+                'active': self._active,
+                'waiting': len(self._waiting),
+                'max_concurrent': self.max_concurrent,
+                'average_queue_wait_seconds': self._stats['queue_wait_seconds'] / started if started else 0.0,
+                'calls_by_model': dict(self._calls_by_model)
+            }
+
+
+# Process-wide scheduler shared by every session
+ollama_scheduler = OllamaScheduler()
@@ -3,32 +3,33 @@ from textwrap import dedent
 
 from crewai import Agent
 from dotenv import load_dotenv
-import litellm
 from langchain.llms.base import LLM
 from typing import Any, Dict, List, Mapping, Optional
 
 # Import the custom tools
 from src.exec_tools.CustomTools import ProgramDiscoveryTool, ProgramExecutionTool
+from src.agents.ollama.OllamaScheduler import ollama_scheduler
 
 load_dotenv()
 
 
-# Create a custom LangChain LLM that uses LiteLLM directly
+# Create a custom LangChain LLM that uses LiteLLM through the Ollama scheduler
 class LiteLLMWrapper(LLM):
     model_name: str = None
+    model_url: str = None
     temperature: float = None
     
     def _llm_type(self) -> str:
         return "custom_litellm"
     
     def _call(self, prompt: str, stop: Optional[List[str]] = None, **kwargs: Any) -> str:
-        response = litellm.completion(
+        return ollama_scheduler.complete(
+            prompt,
             model=self.model_name,
-            messages=[{"role": "user", "content": prompt}],
+            api_base=self.model_url,
             temperature=self.temperature,
             stop=stop
         )
-        return response.choices[0].message.content
 
 
 class ProgramExecutionAgents:
@@ -41,25 +42,28 @@ class ProgramExecutionAgents:
         """
         self.programs_directory = programs_directory
  
-        # Direct LiteLLM integration
+        # LiteLLM integration, scheduled by ollama_scheduler
         self.llm = LiteLLMWrapper(
             model_name=os.getenv("OLLAMA_MODEL", "ollama/llama3").strip(),
             model_url=os.getenv("OLLAMA_BASE_URL", "http://localhost:11434").strip(),
             temperature=float(os.getenv("OLLAMA_TEMPERATURE", 0.7)),
-            max_token=8192,
-            num_ctx=8192
-        )        
+            max_token=8192
+        )
 
-    def program_execution_agent(self):
+    def program_execution_agent(self, use_cache=True, preload_owner=None):
         """
         Create an agent for program discovery and execution.
 
+        Args:
+            use_cache (bool, optional): Set to False to bypass the program result cache
+            preload_owner (str, optional): Session whose preloaded program may be used
+
         Returns:
             Agent: Configured CrewAI agent
         """
         # Create tool instances with the programs directory
         discovery_tool = ProgramDiscoveryTool(self.programs_directory)
-        execution_tool = ProgramExecutionTool()
+        execution_tool = ProgramExecutionTool(use_cache=use_cache, preload_owner=preload_owner)
 
         # Get the LangChain Tool objects
         discovery_langchain_tool = discovery_tool.get_tool()
@@ -83,4 +87,4 @@ class ProgramExecutionAgents:
             ],
             verbose=True,
             llm=self.llm
-        )
\ No newline at end of file
+        )
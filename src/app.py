@@ -1,14 +1,20 @@
 import os
 import time
 import json
+import uuid
+
+from src.profiling.StartupProfiler import startup_profiler
+
+# Start profiling before the remaining imports so they are measured too
+startup_profiler.start()
 
 import streamlit as st
-from crewai import Crew
 from dotenv import load_dotenv
 
-from agents.ollama.ProgramExecutionAgents import ProgramExecutionAgents
+from src.exec_tools.ExecutionHistoryStore import history_store
 from src.exec_tools.ProgramDiscoveryTools import ProgramDiscoveryTools
-from src.tasks.ProgramExecutionTasks import ProgramExecutionTasks
+from src.exec_tools.ProgramPreloader import program_preloader
+from src.exec_tools.ProgramResultCache import result_cache
 
 load_dotenv()
 
@@ -18,14 +24,54 @@ class ProgramExecutionApp:
         self.default_programs_directory = os.getenv('DEFAULT_PROGRAMS_DIRECTORY', 'D:/work/GenAI/crewai/sample_app')
         # Initialize with None, will be set by user
         self.programs_directory = None
-        # Initialize agents and tasks after user selects directory
+        # Agents and tasks pull in CrewAI, LiteLLM and LangChain, so they are
+        # only created on the first LLM-assisted action
         self.agents = None
         self.tasks = None
 
+    def build_execution_crew(self, selected_program, parameters, use_cache=True, preload_owner=None):
+        """
+        Import the agent stack on first use and build the crew that executes a program.
+
+        Args:
+            selected_program (dict): Details of the program to execute
+            parameters (dict): Parameters collected from the user
+            use_cache (bool, optional): Set to False to bypass the program result cache
+            preload_owner (str, optional): Session whose preloaded program may be used
+
+        Returns:
+            Crew: Crew ready to be kicked off
+        """
+        from crewai import Crew
+
+        from agents.ollama.ProgramExecutionAgents import ProgramExecutionAgents
+        from src.tasks.ProgramExecutionTasks import ProgramExecutionTasks
+
+        if self.agents is None:
+            self.agents = ProgramExecutionAgents(self.programs_directory)
+        if self.tasks is None:
+            self.tasks = ProgramExecutionTasks()
+
+        program_agent = self.agents.program_execution_agent(use_cache=use_cache, preload_owner=preload_owner)
+
+        # Create the execution task
+        execute_task = self.tasks.execute_selected_program(
+            program_agent,
+            selected_program,
+            parameters
+        )
+
+        return Crew(
+            agents=[program_agent],
+            tasks=[execute_task],
+            verbose=True
+        )
+
     def run_streamlit_app(self):
         st.set_page_config(layout="wide", page_title="Python Program Execution Assistant")
         
         st.title("🐍 Python Program Execution Assistant")
+        startup_profiler.mark_first_paint()
         
         # Directory Selection Section
         st.header("🔍 Select Programs Directory")
@@ -74,9 +120,9 @@ class ProgramExecutionApp:
                 self.programs_directory = user_input_directory
                 st.session_state.selected_directory = user_input_directory
                 
-                # Initialize the agents and tasks with the selected directory
-                self.agents = ProgramExecutionAgents(self.programs_directory)
-                self.tasks = ProgramExecutionTasks()
+                # Programs from the previous directory will not be executed
+                if 'preload_owner' in st.session_state:
+                    program_preloader.cancel(st.session_state.preload_owner)
                 
                 st.success(f"Directory confirmed: {self.programs_directory}")
             else:
@@ -88,11 +134,6 @@ class ProgramExecutionApp:
         # Store directory in session state for persistence
         if 'selected_directory' in st.session_state:
             self.programs_directory = st.session_state.selected_directory
-            # Ensure agents and tasks are initialized
-            if self.agents is None:
-                self.agents = ProgramExecutionAgents(self.programs_directory)
-            if self.tasks is None:
-                self.tasks = ProgramExecutionTasks()
         
         # Only display rest of the app if directory is selected
         if self.programs_directory:
@@ -137,11 +178,14 @@ class ProgramExecutionApp:
 
                 # Program Selection and Execution
                 st.header("Program Execution")
+                bypass_cache = False
                 
                 # Only show program selection if programs are discovered
                 if 'discovered_programs' in st.session_state and st.session_state.discovered_programs:
                     # Create a dropdown for program selection instead of text input
                     program_names = [p['name'] for p in st.session_state.discovered_programs]
+                    if 'preload_owner' not in st.session_state:
+                        st.session_state.preload_owner = uuid.uuid4().hex
                     selected_program_name = st.selectbox("Select Program", options=program_names)
                     
                     if selected_program_name:
@@ -149,6 +193,9 @@ class ProgramExecutionApp:
                         selected_program = next((p for p in st.session_state.discovered_programs if p['name'] == selected_program_name), None)
                         
                         if selected_program:
+                            # Load the program in the background while parameters are entered
+                            program_preloader.preload(st.session_state.preload_owner, selected_program['path'])
+                            
                             st.write(f"Selected Program: {selected_program['name']}")
                             st.write(f"Path: {selected_program['path']}")
                             
@@ -158,6 +205,23 @@ class ProgramExecutionApp:
                                 param_value = st.text_input(f"Enter value for parameter '{param}'")
                                 if param_value:
                                     parameters[param] = param_value
+                            
+                            # Result cache controls for programs that opt in to memoization
+                            bypass_cache = st.checkbox(
+                                "Bypass result cache",
+                                value=False,
+                                help="Always run the program, even if a cached result exists for these parameters"
+                            )
+                            with st.expander("Result cache statistics"):
+                                cache_report = result_cache.report()
+                                st.write(f"Hits: {cache_report['hits']} | Misses: {cache_report['misses']} | "
+                                         f"Hit rate: {cache_report['hit_rate']:.0%}")
+                                st.write(f"Entries: {cache_report['size']}/{cache_report['max_entries']} | "
+                                         f"Evictions: {cache_report['evictions']} | Expirations: {cache_report['expirations']}")
+                                if cache_report['hits_by_program']:
+                                    st.write("Hits by program:")
+                                    for program_name, hits in cache_report['hits_by_program'].items():
+                                        st.write(f"- {program_name}: {hits}")
                         else:
                             st.error(f"Program '{selected_program_name}' not found.")
                 else:
@@ -176,19 +240,11 @@ class ProgramExecutionApp:
                         
                         if execute_button:
                             # Initialize CrewAI Agents and Tasks
-                            program_agent = self.agents.program_execution_agent()
-                            
-                            # Create the execution task
-                            execute_task = self.tasks.execute_selected_program(
-                                program_agent,
+                            crew = self.build_execution_crew(
                                 selected_program,
-                                parameters
-                            )
-                            
-                            crew = Crew(
-                                agents=[program_agent],
-                                tasks=[execute_task],
-                                verbose=True
+                                parameters,
+                                use_cache=not bypass_cache,
+                                preload_owner=st.session_state.preload_owner
                             )
                             
                             # Show progress and execution details in the right column
@@ -239,6 +295,8 @@ class ProgramExecutionApp:
                                 execution_log.code("\n".join(execution_logs), language="text", height=600)
                                 
                                 # Step 5: Execute program using CrewAI
+                                crew_started_at = time.time()
+                                crew_start = time.perf_counter()
                                 try:
                                     # Capture CrewAI's verbose output
                                     import io
@@ -250,6 +308,17 @@ class ProgramExecutionApp:
                                     with redirect_stdout(f):
                                         result = crew.kickoff()
                                     
+                                    history_store.record(
+                                        program=selected_program['name'],
+                                        path=selected_program['path'],
+                                        source='crew',
+                                        parameters=parameters,
+                                        started_at=crew_started_at,
+                                        total_ms=(time.perf_counter() - crew_start) * 1000,
+                                        status='success',
+                                        result=result
+                                    )
+                                    
                                     # Get the CrewAI output and add it to execution logs
                                     crewai_output = f.getvalue()
                                     execution_logs.append("\n--- Agent Execution Details ---\n")
@@ -266,6 +335,16 @@ class ProgramExecutionApp:
                                     st.session_state.execution_success = True
                                     st.session_state.crewai_output = crewai_output
                                 except Exception as e:
+                                    history_store.record(
+                                        program=selected_program['name'],
+                                        path=selected_program['path'],
+                                        source='crew',
+                                        parameters=parameters,
+                                        started_at=crew_started_at,
+                                        total_ms=(time.perf_counter() - crew_start) * 1000,
+                                        status='error',
+                                        result=str(e)
+                                    )
                                     progress_value = 100
                                     progress_placeholder.progress(progress_value / 100)
                                     status_text.write(f"❌ Program execution failed! ({progress_value}%)")
@@ -303,6 +382,23 @@ class ProgramExecutionApp:
                 st.error("⚠️ Program execution failed")
                 st.markdown("### Error Details")
                 st.code(st.session_state.execution_result)
+        
+        # Startup profile, enabled with STARTUP_PROFILE=1
+        if startup_profiler.enabled:
+            self.display_startup_profile()
+    
+    def display_startup_profile(self):
+        """Show time to first paint and the slowest imports"""
+        report = startup_profiler.report()
+        with st.expander("⏱️ Startup Profile"):
+            if report['startup_first_paint_ms'] is not None:
+                st.write(f"Time to first paint at startup: {report['startup_first_paint_ms']:.1f} ms")
+            if report['first_paint_ms'] is not None:
+                st.write(f"Time to first paint in this run: {report['first_paint_ms']:.1f} ms")
+            if report['imports']:
+                st.dataframe(report['imports'])
+            else:
+                st.write("No imports recorded at startup.")
     
     def display_formatted_results(self, result_data):
         """Display results in a beautiful and user-friendly format"""
@@ -24,6 +24,10 @@ class ProgramDiscoveryTool:
 class ProgramExecutionTool:
     """Wrapper for the program execution functionality"""
     
+    def __init__(self, use_cache: bool = True, preload_owner: Optional[str] = None):
+        self.use_cache = use_cache
+        self.preload_owner = preload_owner
+        
     def __call__(self, program: Dict[str, Any], parameters: Optional[Dict[str, Any]] = None) -> Any:
         """Run the tool"""
         from src.exec_tools.ProgramExecutionTools import ProgramExecutionTools
@@ -34,7 +38,9 @@ class ProgramExecutionTool:
         # Execute the program
         success, result = ProgramExecutionTools.execute_program(
             program['path'],
-            parameters
+            parameters,
+            use_cache=self.use_cache,
+            preload_owner=self.preload_owner
         )
         
         # Handle the result
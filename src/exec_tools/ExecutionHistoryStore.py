@@ -0,0 +1,320 @@
+import atexit
+import hashlib
+import json
+import math
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+from src.exec_tools.ProgramResultCache import ProgramResultCache
+
+
+class ExecutionHistoryStore:
+    """
+    Persist every program run to a local SQLite database (WAL mode).
+
+    record() only takes a shallow snapshot of the run and puts it on an
+    in-memory queue; a background writer thread hashes parameters, measures
+    result sizes and inserts runs in batches, so recording adds neither I/O
+    nor serialization to an execution. Queries open their own connections,
+    which WAL lets run alongside the writer.
+
+    A UI execution produces two rows: a 'crew' row covering the whole agent
+    run including LLM time, and a 'direct' row for the execute_program call
+    the agent's tool makes. Queries therefore look at one source at a time,
+    'direct' by default.
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS executions (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        program TEXT NOT NULL,
+        path TEXT,
+        source TEXT NOT NULL,
+        parameters_hash TEXT,
+        started_at REAL NOT NULL,
+        load_ms REAL,
+        execute_ms REAL,
+        total_ms REAL NOT NULL,
+        status TEXT NOT NULL,
+        cached INTEGER NOT NULL DEFAULT 0,
+        result_size INTEGER
+    );
+    CREATE INDEX IF NOT EXISTS idx_executions_program_started ON executions (program, started_at);
+    CREATE INDEX IF NOT EXISTS idx_executions_started ON executions (started_at);
+    """
+
+    INSERT = ("INSERT INTO executions (program, path, source, parameters_hash, started_at, "
+              "load_ms, execute_ms, total_ms, status, cached, result_size) "
+              "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)")
+
+    def __init__(self, db_path=None, batch_size=None, flush_interval=None, max_queue=None):
+        """
+        Args:
+            db_path (str, optional): Path to the SQLite database file
+            batch_size (int, optional): Maximum number of runs written per transaction
+            flush_interval (float, optional): Seconds the writer waits before writing a partial batch
+            max_queue (int, optional): Runs buffered in memory before new ones are dropped
+        """
+        self.db_path = db_path or os.getenv('EXECUTION_HISTORY_DB', 'execution_history.db')
+        self.batch_size = batch_size if batch_size is not None else int(os.getenv('EXECUTION_HISTORY_BATCH_SIZE', 100))
+        self.flush_interval = flush_interval if flush_interval is not None else float(os.getenv('EXECUTION_HISTORY_FLUSH_INTERVAL', 1.0))
+        self._queue = queue.Queue(maxsize=max_queue if max_queue is not None else 10000)
+        self._writer = None
+        self._writer_lock = threading.Lock()
+        self._schema_ready = False
+        self.dropped = 0
+
+    def _connect(self):
+        connection = sqlite3.connect(self.db_path, timeout=30)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        if not self._schema_ready:
+            connection.executescript(self.SCHEMA)
+            self._schema_ready = True
+        return connection
+
+    def _ensure_writer(self):
+        if self._writer is not None:
+            return
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_loop, name='execution-history-writer', daemon=True)
+                self._writer.start()
+                atexit.register(self.flush)
+
+    def record(self, program, source, started_at, total_ms, status, path=None, parameters=None,
+               load_ms=None, execute_ms=None, cached=False, result=None):
+        """
+        Queue a run for writing. Never blocks; runs are dropped if the queue is full.
+
+        Parameters and result are copied shallowly, so replacing their top-level
+        items after the call does not change what is recorded; hashing and
+        serialization happen on the writer thread.
+
+        Args:
+            program (str): Program name
+            source (str): Where the run came from, 'direct' or 'crew'
+            started_at (float): Unix timestamp of the start of the run
+            total_ms (float): Wall time of the run in milliseconds
+            status (str): 'success' or 'error'
+            path (str, optional): Full path to the Python file
+            parameters (dict, optional): Parameters the program was called with
+            load_ms (float, optional): Time spent loading the program
+            execute_ms (float, optional): Time spent in execute()
+            cached (bool, optional): Whether the result came from the result cache
+            result (Any, optional): Result or error details, used to measure the result size
+        """
+        self._ensure_writer()
+        try:
+            self._queue.put_nowait({
+                'program': program,
+                'path': path,
+                'source': source,
+                'parameters': self._snapshot(parameters),
+                'started_at': started_at,
+                'load_ms': load_ms,
+                'execute_ms': execute_ms,
+                'total_ms': total_ms,
+                'status': status,
+                'cached': cached,
+                'result': self._snapshot(result)
+            })
+        except queue.Full:
+            self.dropped += 1
+
+    def flush(self, timeout=5.0):
+        """
+        Wait until every run queued so far has been written.
+
+        Returns:
+            bool: True if the writer caught up within the timeout
+        """
+        if self._writer is None:
+            return True
+        written = threading.Event()
+        try:
+            self._queue.put(written, timeout=timeout)
+        except queue.Full:
+            return False
+        return written.wait(timeout)
+
+    @staticmethod
+    def _snapshot(value):
+        """Shallow copy of built-in containers; any other value is kept as is."""
+        if type(value) in (dict, list, set, bytearray):
+            return type(value)(value)
+        return value
+
+    @staticmethod
+    def _parameters_hash(parameters):
+        """SHA-256 of the normalized parameters, or None if they cannot be serialized."""
+        try:
+            parameters_key = ProgramResultCache.normalize_parameters(parameters)
+        except Exception:
+            try:
+                parameters_key = repr(parameters)
+            except Exception:
+                return None
+        return hashlib.sha256(parameters_key.encode('utf-8', 'replace')).hexdigest()
+
+    @staticmethod
+    def _result_size(result):
+        """Length of the serialized result, or None if it cannot be serialized."""
+        if result is None:
+            return 0
+        try:
+            return len(json.dumps(result, default=str))
+        except Exception:
+            try:
+                return len(str(result))
+            except Exception:
+                return None
+
+    @staticmethod
+    def _to_row(run):
+        return (
+            run['program'],
+            run['path'],
+            run['source'],
+            ExecutionHistoryStore._parameters_hash(run['parameters']),
+            run['started_at'],
+            run['load_ms'],
+            run['execute_ms'],
+            run['total_ms'],
+            run['status'],
+            int(bool(run['cached'])),
+            ExecutionHistoryStore._result_size(run['result'])
+        )
+
+    def _write_loop(self):
+        connection = self._connect()
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size and not isinstance(batch[-1], threading.Event):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            runs = [item for item in batch if not isinstance(item, threading.Event)]
+            try:
+                if runs:
+                    self._write_rows(connection, [self._to_row(run) for run in runs])
+            finally:
+                for item in batch:
+                    if isinstance(item, threading.Event):
+                        item.set()
+
+    def _write_rows(self, connection, rows):
+        """Insert a batch in one transaction, falling back to one row at a time if it fails."""
+        try:
+            with connection:
+                connection.executemany(self.INSERT, rows)
+            return
+        except Exception as e:
+            print(f"Error writing execution history batch, retrying row by row: {e}")
+
+        for row in rows:
+            try:
+                with connection:
+                    connection.execute(self.INSERT, row)
+            except Exception as e:
+                print(f"Error writing execution history for {row[0]}: {e}")
+
+    @staticmethod
+    def _percentile(sorted_values, percentile):
+        """Nearest-rank percentile of an already sorted list."""
+        if not sorted_values:
+            return None
+        rank = max(math.ceil(percentile / 100 * len(sorted_values)), 1)
+        return sorted_values[rank - 1]
+
+    @staticmethod
+    def _summarize(rows, window_seconds, include_cached):
+        """
+        Aggregate (total_ms, status, cached) rows. Result-cache hits take
+        microseconds, so unless include_cached is set they are only counted
+        in cache_hits and left out of every other figure.
+        """
+        cache_hits = sum(1 for row in rows if row[2])
+        if not include_cached:
+            rows = [row for row in rows if not row[2]]
+        durations = sorted(row[0] for row in rows)
+        failures = sum(1 for row in rows if row[1] != 'success')
+        return {
+            'runs': len(rows),
+            'cache_hits': cache_hits,
+            'failures': failures,
+            'failure_rate': failures / len(rows) if rows else 0.0,
+            'p50_ms': ExecutionHistoryStore._percentile(durations, 50),
+            'p95_ms': ExecutionHistoryStore._percentile(durations, 95),
+            'p99_ms': ExecutionHistoryStore._percentile(durations, 99),
+            'throughput_per_hour': len(rows) / (window_seconds / 3600) if window_seconds > 0 else 0.0
+        }
+
+    def _fetch(self, since, source):
+        query = ("SELECT program, started_at, total_ms, status, cached FROM executions "
+                 "WHERE source = ? AND started_at >= ? ORDER BY program, started_at")
+        arguments = [source, since]
+        connection = self._connect()
+        try:
+            return connection.execute(query, arguments).fetchall()
+        finally:
+            connection.close()
+
+    def program_summary(self, since, source='direct', include_cached=False):
+        """
+        Latency percentiles, failure rate and throughput per program.
+
+        Args:
+            since (float): Unix timestamp of the start of the window
+            source (str, optional): 'direct' for program runs, 'crew' for whole agent runs
+            include_cached (bool, optional): Count result-cache hits as regular runs
+
+        Returns:
+            list: One dict per program, slowest p95 first
+        """
+        window_seconds = time.time() - since
+        runs_by_program = {}
+        for program, _, total_ms, status, cached in self._fetch(since, source):
+            runs_by_program.setdefault(program, []).append((total_ms, status, cached))
+
+        summary = [
+            {'program': program, **self._summarize(rows, window_seconds, include_cached)}
+            for program, rows in runs_by_program.items()
+        ]
+        return sorted(summary, key=lambda item: item['p95_ms'] or 0, reverse=True)
+
+    def program_timeseries(self, since, bucket_seconds=3600, source='direct', include_cached=False):
+        """
+        Latency percentiles, failure rate and throughput per program over time.
+
+        Args:
+            since (float): Unix timestamp of the start of the window
+            bucket_seconds (int, optional): Width of each time bucket
+            source (str, optional): 'direct' for program runs, 'crew' for whole agent runs
+            include_cached (bool, optional): Count result-cache hits as regular runs
+
+        Returns:
+            list: One dict per program and time bucket
+        """
+        buckets = {}
+        for program, started_at, total_ms, status, cached in self._fetch(since, source):
+            bucket_start = started_at - (started_at % bucket_seconds)
+            buckets.setdefault((program, bucket_start), []).append((total_ms, status, cached))
+
+        return [
+            {'program': program, 'bucket_start': bucket_start, **self._summarize(rows, bucket_seconds, include_cached)}
+            for (program, bucket_start), rows in sorted(buckets.items(), key=lambda item: (item[0][1], item[0][0]))
+        ]
+
+
+# Process-wide store shared by every session
+history_store = ExecutionHistoryStore()
@@ -1,7 +1,8 @@
-import importlib.util
 import inspect
 import os
 
+from src.exec_tools.ProgramLoader import ProgramLoader
+
 
 class ProgramDiscoveryTools:
     @staticmethod
@@ -67,39 +68,33 @@ class ProgramDiscoveryTools:
             if not os.path.isfile(file_path):
                 return None
 
-            module_name = os.path.splitext(os.path.basename(file_path))[0]
-
-            # Use importlib to safely import the module
-            spec = importlib.util.spec_from_file_location(module_name, file_path)
-            module = importlib.util.module_from_spec(spec)
-
-            # Add the directory to sys.path temporarily
-            import sys
-            original_path = sys.path.copy()
-            sys.path.insert(0, os.path.dirname(file_path))
+            # Load the module in its own namespace, without touching sys.path
+            loader = ProgramLoader(file_path)
+            module_name = loader.module_name
 
             try:
-                spec.loader.exec_module(module)
-            except Exception as e:
-                print(f"Error loading module {file_path}: {e}")
-                return None
+                try:
+                    module = loader.load()
+                except Exception as e:
+                    print(f"Error loading module {file_path}: {e}")
+                    return None
+
+                # Find the execute function
+                execute_func = getattr(module, 'execute', None)
+
+                if execute_func and callable(execute_func):
+                    # Inspect function parameters
+                    signature = inspect.signature(execute_func)
+                    parameters = list(signature.parameters.keys())
+
+                    return {
+                        'name': module_name,
+                        'path': file_path,
+                        'parameters': parameters
+                    }
             finally:
-                # Restore original sys.path
-                sys.path = original_path
-
-            # Find the execute function
-            execute_func = getattr(module, 'execute', None)
-
-            if execute_func and callable(execute_func):
-                # Inspect function parameters
-                signature = inspect.signature(execute_func)
-                parameters = list(signature.parameters.keys())
-
-                return {
-                    'name': module_name,
-                    'path': file_path,
-                    'parameters': parameters
-                }
+                # The module was only needed for inspection
+                loader.unload()
 
         except Exception as e:
             print(f"Error inspecting {file_path}: {e}")
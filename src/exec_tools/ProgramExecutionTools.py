@@ -1,30 +1,75 @@
-import importlib.util
 import os
-import sys
+import time
 import traceback
 
+from src.exec_tools.ExecutionHistoryStore import history_store
+from src.exec_tools.ProgramLoader import ProgramLoader
+from src.exec_tools.ProgramPreloader import program_preloader
+from src.exec_tools.ProgramResultCache import ProgramResultCache, result_cache
+
 
 class ProgramExecutionTools:
     @staticmethod
-    def execute_program(file_path, parameters=None):
+    def execute_program(file_path, parameters=None, use_cache=True, preload_owner=None):
         """
         Dynamically load and execute a Python program with optional parameters.
 
+        Programs that opt in to memoization (see ProgramResultCache) are served
+        from the result cache when the same source and parameters were run before.
+        A module preloaded by ProgramPreloader for preload_owner is used instead
+        of loading it again.
+        Every run is recorded in the execution history store.
+
         Args:
             file_path (str): Full path to the Python file
             parameters (dict, optional): Parameters to pass to execute() function
+            use_cache (bool, optional): Set to False to bypass the result cache
+            preload_owner (str, optional): Session whose preloaded module may be used
 
         Returns:
             tuple: (success, result/error)
         """
-        try:
-            # Add the directory containing the program to Python path
-            sys.path.insert(0, os.path.dirname(file_path))
+        started_at = time.time()
+        start = time.perf_counter()
+        timings = {'load_ms': None, 'execute_ms': None, 'cached': False}
 
-            module_name = os.path.splitext(os.path.basename(file_path))[0]
-            spec = importlib.util.spec_from_file_location(module_name, file_path)
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
+        success, result = ProgramExecutionTools._run_program(file_path, parameters, use_cache, preload_owner, timings)
+
+        history_store.record(
+            program=os.path.splitext(os.path.basename(file_path))[0],
+            path=file_path,
+            source='direct',
+            parameters=parameters,
+            started_at=started_at,
+            total_ms=(time.perf_counter() - start) * 1000,
+            status='success' if success else 'error',
+            result=result,
+            **timings
+        )
+        return success, result
+
+    @staticmethod
+    def _run_program(file_path, parameters, use_cache, preload_owner, timings):
+        """Load and run a program, filling timings with load/execute durations."""
+        cache_key = None
+        if use_cache and ProgramResultCache.is_marked_cacheable(file_path):
+            try:
+                cache_key = result_cache.make_key(file_path, parameters)
+                found, cached_result = result_cache.get(cache_key)
+                if found:
+                    timings['cached'] = True
+                    return True, cached_result
+            except OSError:
+                cache_key = None
+
+        loader = None
+        try:
+            # Load the program and its local imports into a private namespace,
+            # unless it was already preloaded while parameters were entered
+            load_start = time.perf_counter()
+            loader = program_preloader.take(preload_owner, file_path) or ProgramLoader(file_path)
+            module = loader.load()
+            timings['load_ms'] = (time.perf_counter() - load_start) * 1000
 
             # Call execute function with parameters
             execute_func = getattr(module, 'execute', None)
@@ -34,7 +79,12 @@ class ProgramExecutionTools:
 
             # Prepare parameters
             parameters = parameters or {}
+            execute_start = time.perf_counter()
             result = execute_func(**parameters)
+            timings['execute_ms'] = (time.perf_counter() - execute_start) * 1000
+
+            if cache_key is not None and ProgramResultCache.is_cacheable(module):
+                result_cache.put(cache_key, result)
 
             return True, result
 
@@ -45,5 +95,5 @@ class ProgramExecutionTools:
             }
             return False, error_details
         finally:
-            # Remove the temporarily added path
-            sys.path.pop(0)
+            if loader is not None:
+                loader.release()
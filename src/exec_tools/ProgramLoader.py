@@ -0,0 +1,221 @@
+import builtins
+import hashlib
+import importlib.util
+import os
+import sys
+import threading
+import types
+
+
+class ProgramLoader:
+    """
+    Load a Python program and its local imports without sharing them between runs.
+
+    The program and the modules next to it are loaded as submodules of a
+    namespace package named after the program path (``_program_<hash>``)
+    whose ``__path__`` is the program's directory, so a helper imported as
+    ``helper`` becomes ``_program_<hash>.helper``. The names are stable across
+    runs, so anything keyed on ``__name__``, such as
+    ``logging.getLogger(__name__)``, is reused rather than created again on
+    every run.
+
+    Each loader still executes its own copies of the modules and keeps them in
+    its ``modules`` dict: local ``import`` statements are served from there
+    through a per-run ``__import__`` placed in the loaded modules' builtins, so
+    concurrent runs never see each other's module state. Imports of anything
+    else (standard library, installed packages) fall through to the regular
+    import system. ``importlib.import_module('helper')`` bypasses
+    ``__import__`` and therefore does not see local modules; use
+    ``importlib.import_module(__package__ + '.helper')`` instead.
+
+    Loading also registers the modules in sys.modules under their stable names,
+    so tools that look modules up there (dataclasses, pickle, typing) keep
+    working. Those entries point at the most recently loaded run; results of
+    an older run that overlapped a newer one may therefore fail to pickle.
+    release() keeps the latest finished run of each program and unloads the
+    one it replaces, and unload() only removes entries still pointing at its
+    own modules.
+    """
+
+    # Latest released loader per program path
+    _retained = {}
+    _retained_lock = threading.Lock()
+
+    def __init__(self, file_path):
+        """
+        Args:
+            file_path (str): Full path to the Python file
+        """
+        self.file_path = os.path.abspath(file_path)
+        self.base_dir = os.path.dirname(self.file_path)
+        self.module_name = os.path.splitext(os.path.basename(file_path))[0]
+        self.namespace = self.namespace_for(self.file_path)
+        self.modules = {}
+        self._lock = threading.RLock()
+        self._builtins = dict(vars(builtins))
+        self._builtins['__import__'] = self._import
+
+        self.package = types.ModuleType(self.namespace)
+        self.package.__path__ = [self.base_dir]
+        self.package.__package__ = self.namespace
+        sys.modules[self.namespace] = self.package
+
+    @staticmethod
+    def namespace_for(file_path):
+        """
+        Stable namespace package name for a program.
+
+        Args:
+            file_path (str): Full path to the Python file
+
+        Returns:
+            str: ``_program_`` followed by a hash of the absolute path
+        """
+        digest = hashlib.sha256(os.path.abspath(file_path).encode('utf-8')).hexdigest()
+        return f"_program_{digest[:16]}"
+
+    @staticmethod
+    def resolve_local_module(name, base_dir):
+        """
+        Map a dotted module name to a file inside base_dir.
+
+        Args:
+            name (str): Absolute dotted module name
+            base_dir (str): Directory the program lives in
+
+        Returns:
+            tuple: (path, is_package) or (None, False) if the module is not local
+        """
+        candidate = os.path.join(base_dir, *name.split('.'))
+        package_init = os.path.join(candidate, '__init__.py')
+        if os.path.isfile(package_init):
+            return package_init, True
+        if os.path.isfile(candidate + '.py'):
+            return candidate + '.py', False
+        return None, False
+
+    def load(self):
+        """
+        Load the program itself. Calling it again returns the already loaded module.
+
+        Returns:
+            module: The executed program module
+        """
+        with self._lock:
+            return self._load_module(self.module_name, self.file_path, is_package=False)
+
+    def release(self):
+        """
+        Mark the run as finished, unloading the previous finished run of the same program.
+        """
+        with ProgramLoader._retained_lock:
+            previous = ProgramLoader._retained.get(self.file_path)
+            ProgramLoader._retained[self.file_path] = self
+        if previous is not None and previous is not self:
+            previous.unload()
+
+    def unload(self):
+        """Remove this run's modules from sys.modules, leaving entries a newer run replaced."""
+        with ProgramLoader._retained_lock:
+            if ProgramLoader._retained.get(self.file_path) is self:
+                del ProgramLoader._retained[self.file_path]
+        registered = [(f"{self.namespace}.{name}", module) for name, module in list(self.modules.items())]
+        registered.append((self.namespace, self.package))
+        for qualified_name, module in registered:
+            if sys.modules.get(qualified_name) is module:
+                sys.modules.pop(qualified_name, None)
+
+    def _load_module(self, name, path, is_package):
+        """Execute a local module into this loader's namespace."""
+        if name in self.modules:
+            return self.modules[name]
+
+        qualified_name = f"{self.namespace}.{name}"
+        spec = importlib.util.spec_from_file_location(
+            qualified_name,
+            path,
+            submodule_search_locations=[os.path.dirname(path)] if is_package else None
+        )
+        module = importlib.util.module_from_spec(spec)
+        module.__builtins__ = self._builtins
+
+        # Register before executing so circular imports and sys.modules lookups resolve
+        self.modules[name] = module
+        sys.modules[qualified_name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del self.modules[name]
+            if sys.modules.get(qualified_name) is module:
+                del sys.modules[qualified_name]
+            raise
+
+        parent_name, _, child_name = name.rpartition('.')
+        parent = self.modules.get(parent_name) if parent_name else self.package
+        if parent is not None:
+            setattr(parent, child_name, module)
+
+        return module
+
+    def _load_local(self, name):
+        """Load a local module and its parent packages, or return None if it is not local."""
+        top_level = name.partition('.')[0]
+        if top_level not in self.modules and self.resolve_local_module(top_level, self.base_dir)[0] is None:
+            return None
+
+        module = None
+        parts = name.split('.')
+        for index in range(1, len(parts) + 1):
+            current = '.'.join(parts[:index])
+            if current in self.modules:
+                module = self.modules[current]
+                continue
+            path, is_package = self.resolve_local_module(current, self.base_dir)
+            if path is None:
+                raise ModuleNotFoundError(f"No module named '{current}'", name=current)
+            module = self._load_module(current, path, is_package)
+        return module
+
+    def _local_name(self, name, module_globals, level):
+        """Turn an import into a name relative to the program directory, or None if it is not local."""
+        if level:
+            package = (module_globals or {}).get('__package__') or ''
+            name = importlib.util.resolve_name('.' * level + name, package)
+        if name == self.namespace:
+            return ''
+        if name.startswith(self.namespace + '.'):
+            return name[len(self.namespace) + 1:]
+        return None if level else name
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        """Replacement for __import__ that serves local modules from this loader."""
+        local_name = self._local_name(name, globals, level)
+        if local_name is None:
+            return builtins.__import__(name, globals, locals, fromlist, level)
+
+        with self._lock:
+            if local_name == '':
+                # "from . import helper" in the program itself
+                for item in fromlist or ():
+                    if item != '*' and self.resolve_local_module(item, self.base_dir)[0] is not None:
+                        self._load_local(item)
+                return self.package
+
+            module = self._load_local(local_name)
+            if module is None:
+                return builtins.__import__(name, globals, locals, fromlist, level)
+
+            if not fromlist:
+                # "import a.b.c" binds the top-level package
+                if level or name.startswith(self.namespace + '.'):
+                    return self.package
+                return self.modules[local_name.partition('.')[0]]
+
+            # "from package import submodule" needs the submodule loaded
+            if hasattr(module, '__path__'):
+                for item in fromlist:
+                    if item != '*' and not hasattr(module, item):
+                        submodule_name = f"{local_name}.{item}"
+                        if self.resolve_local_module(submodule_name, self.base_dir)[0] is not None:
+                            self._load_local(submodule_name)
+            return module
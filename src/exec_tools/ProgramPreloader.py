@@ -0,0 +1,170 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from src.exec_tools.ProgramLoader import ProgramLoader
+from src.exec_tools.ProgramResultCache import ProgramResultCache
+
+
+class ProgramPreloader:
+    """
+    Speculatively load a selected program in the background.
+
+    While the user fills in parameters, the program module is loaded and its
+    module-level code executed on a worker thread, so executing it afterwards
+    only pays for execute(). Every owner (a UI session) holds at most one
+    preload, which only that owner can claim; selecting another program
+    discards the previous one. Preloads not refreshed or claimed within the
+    TTL, such as those of ended sessions, are evicted and unloaded.
+    """
+
+    def __init__(self, max_concurrent=None, ttl_seconds=None):
+        """
+        Args:
+            max_concurrent (int, optional): Maximum number of preloads running at once
+            ttl_seconds (float, optional): Seconds a preload is kept without being refreshed or claimed
+        """
+        self.max_concurrent = max_concurrent if max_concurrent is not None else int(os.getenv('PROGRAM_PRELOAD_MAX_CONCURRENT', 2))
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else float(os.getenv('PROGRAM_PRELOAD_TTL', 300))
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrent, thread_name_prefix='program-preload')
+        self._preloads = {}
+        self._lock = threading.Lock()
+        self._stats = {'started': 0, 'used': 0, 'discarded': 0, 'expired': 0, 'stale': 0, 'failed': 0}
+
+    @staticmethod
+    def _load(file_path):
+        loader = ProgramLoader(file_path)
+        try:
+            loader.load()
+        except BaseException:
+            loader.unload()
+            raise
+        return loader
+
+    @staticmethod
+    def _unload_when_done(future):
+        """Unload a discarded preload's modules once its worker has finished."""
+        if not future.cancelled() and future.exception() is None:
+            future.result().unload()
+
+    def preload(self, owner, file_path):
+        """
+        Start loading a program for an owner, replacing the owner's previous preload.
+
+        Calling it again for the same program keeps the existing preload alive.
+
+        Args:
+            owner (str): Identifier of the session requesting the preload
+            file_path (str): Full path to the Python file
+        """
+        file_path = os.path.abspath(file_path)
+        with self._lock:
+            self._evict_expired()
+            entry = self._preloads.get(owner)
+            if entry is not None and entry['path'] == file_path:
+                entry['refreshed_at'] = time.monotonic()
+                return
+
+        try:
+            fingerprint = ProgramResultCache.source_fingerprint(file_path)
+        except OSError:
+            self.cancel(owner)
+            return
+
+        with self._lock:
+            entry = self._preloads.pop(owner, None)
+            if entry is not None:
+                self._discard(entry)
+            self._preloads[owner] = {
+                'path': file_path,
+                'fingerprint': fingerprint,
+                'refreshed_at': time.monotonic(),
+                'future': self._executor.submit(self._load, file_path)
+            }
+            self._stats['started'] += 1
+
+    def cancel(self, owner):
+        """Discard the owner's preload, if any."""
+        with self._lock:
+            entry = self._preloads.pop(owner, None)
+            if entry is not None:
+                self._discard(entry)
+
+    def _discard(self, entry, reason='discarded'):
+        # A queued preload never starts; a running one finishes on its worker
+        # and its modules are unloaded afterwards
+        if not entry['future'].cancel():
+            entry['future'].add_done_callback(self._unload_when_done)
+        self._stats[reason] += 1
+
+    def _evict_expired(self):
+        """Discard preloads whose owner stopped refreshing them. Call with the lock held."""
+        now = time.monotonic()
+        for owner in [owner for owner, entry in self._preloads.items()
+                      if now - entry['refreshed_at'] > self.ttl_seconds]:
+            self._discard(self._preloads.pop(owner), reason='expired')
+
+    def take(self, owner, file_path):
+        """
+        Claim a preloaded program for execution.
+
+        A preload that is still running is waited for, since loading the program
+        again would take at least as long. A preload still queued behind others
+        is cancelled so the caller loads the program directly.
+
+        Args:
+            owner (str): Identifier of the session that requested the preload
+            file_path (str): Full path to the Python file
+
+        Returns:
+            ProgramLoader: Loader holding the loaded program, or None if no usable preload exists
+        """
+        if owner is None:
+            return None
+        file_path = os.path.abspath(file_path)
+        with self._lock:
+            self._evict_expired()
+            entry = self._preloads.get(owner)
+            if entry is None or entry['path'] != file_path:
+                return None
+            del self._preloads[owner]
+            if entry['future'].cancel():
+                self._stats['discarded'] += 1
+                return None
+
+        try:
+            loader = entry['future'].result()
+        except Exception:
+            # Let the caller reload the program and report the error with its traceback
+            with self._lock:
+                self._stats['failed'] += 1
+            return None
+
+        try:
+            current_fingerprint = ProgramResultCache.source_fingerprint(file_path)
+        except OSError:
+            current_fingerprint = None
+
+        with self._lock:
+            stale = current_fingerprint != entry['fingerprint']
+            self._stats['stale' if stale else 'used'] += 1
+        if stale:
+            loader.unload()
+            return None
+        return loader
+
+    def report(self):
+        """
+        Summarize preloading activity.
+
+        Returns:
+            dict: Counters and the number of preloads currently held
+        """
+        with self._lock:
+            self._evict_expired()
+            return {**self._stats, 'pending': len(self._preloads), 'max_concurrent': self.max_concurrent}
+
+
+# Process-wide preloader shared by every session
+program_preloader = ProgramPreloader()
@@ -0,0 +1,237 @@
+import ast
+import copy
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from src.exec_tools.ProgramLoader import ProgramLoader
+
+
+class ProgramResultCache:
+    """
+    In-memory memoization of execute() results for programs that opt in.
+
+    Programs opt in with a literal module-level ``CACHEABLE = True`` marker.
+    Entries are keyed on the program source hash, the hashes of its transitive
+    local imports and the normalized parameters, so editing the program or any
+    helper module next to it invalidates the cached result.
+    """
+
+    # Opt-in marker checks per path, with the (mtime, size) they were made for
+    _marker_checks = {}
+    _marker_lock = threading.Lock()
+
+    def __init__(self, max_entries=None, ttl_seconds=None):
+        """
+        Args:
+            max_entries (int, optional): Maximum number of cached results
+            ttl_seconds (float, optional): Lifetime of a cached result in seconds
+        """
+        self.max_entries = max_entries if max_entries is not None else int(os.getenv('PROGRAM_CACHE_MAX_ENTRIES', 256))
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else float(os.getenv('PROGRAM_CACHE_TTL', 3600))
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'stores': 0, 'evictions': 0, 'expirations': 0}
+        self._hits_by_program = {}
+
+    @staticmethod
+    def is_cacheable(module):
+        """Check whether a loaded program opted in to memoization."""
+        return getattr(module, 'CACHEABLE', False) is True
+
+    @classmethod
+    def is_marked_cacheable(cls, file_path):
+        """
+        Check, without loading the program, whether it declares ``CACHEABLE = True``.
+
+        Only the program file itself is parsed, and the answer is remembered
+        until the file changes, so programs that did not opt in pay for a stat().
+
+        Args:
+            file_path (str): Full path to the Python file
+
+        Returns:
+            bool: True if the program opted in to memoization
+        """
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return False
+        path = os.path.abspath(file_path)
+        version = (stat.st_mtime_ns, stat.st_size)
+
+        with cls._marker_lock:
+            checked_version, marked = cls._marker_checks.get(path, (None, False))
+            if checked_version == version:
+                return marked
+
+        try:
+            with open(file_path, 'rb') as source_file:
+                tree = ast.parse(source_file.read(), filename=file_path)
+        except (OSError, SyntaxError, ValueError):
+            return False
+
+        marked = False
+        for node in tree.body:
+            if (isinstance(node, ast.Assign)
+                    and any(isinstance(target, ast.Name) and target.id == 'CACHEABLE' for target in node.targets)):
+                marked = isinstance(node.value, ast.Constant) and node.value.value is True
+
+        with cls._marker_lock:
+            cls._marker_checks[path] = (version, marked)
+        return marked
+
+    @staticmethod
+    def normalize_parameters(parameters):
+        """
+        Build a canonical representation of the parameters so that the same
+        inputs passed in a different key order share a cache entry.
+        """
+        return json.dumps(parameters or {}, sort_keys=True, default=repr)
+
+    @staticmethod
+    def _local_imports(file_path, base_dir):
+        """Return the local files imported by file_path."""
+        try:
+            with open(file_path, 'rb') as source_file:
+                tree = ast.parse(source_file.read(), filename=file_path)
+        except (OSError, SyntaxError, ValueError):
+            return []
+
+        names = []
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                names.extend(alias.name for alias in node.names)
+            elif isinstance(node, ast.ImportFrom):
+                if node.level:
+                    package_dir = os.path.dirname(file_path)
+                    for _ in range(node.level - 1):
+                        package_dir = os.path.dirname(package_dir)
+                    prefix = os.path.relpath(package_dir, base_dir).replace(os.path.sep, '.')
+                    prefix = '' if prefix == '.' else prefix + '.'
+                else:
+                    prefix = ''
+                if node.module:
+                    names.append(prefix + node.module)
+                # "from pkg import submodule" may name modules rather than attributes
+                names.extend(prefix + (node.module + '.' if node.module else '') + alias.name
+                             for alias in node.names)
+
+        paths = []
+        for name in names:
+            path, _ = ProgramLoader.resolve_local_module(name, base_dir)
+            if path and path not in paths:
+                paths.append(path)
+        return paths
+
+    @staticmethod
+    def source_fingerprint(file_path):
+        """
+        Hash a program together with every local module it transitively imports.
+
+        Args:
+            file_path (str): Full path to the Python file
+
+        Returns:
+            str: Hex digest covering the program and its local dependencies
+        """
+        base_dir = os.path.dirname(os.path.abspath(file_path))
+        digest = hashlib.sha256()
+        pending = [os.path.abspath(file_path)]
+        seen = set()
+
+        while pending:
+            path = pending.pop()
+            if path in seen:
+                continue
+            seen.add(path)
+            pending.extend(ProgramResultCache._local_imports(path, base_dir))
+
+        for path in sorted(seen):
+            with open(path, 'rb') as source_file:
+                digest.update(os.path.relpath(path, base_dir).encode('utf-8'))
+                digest.update(hashlib.sha256(source_file.read()).digest())
+
+        return digest.hexdigest()
+
+    def make_key(self, file_path, parameters):
+        """Build the cache key for a program invocation."""
+        return (
+            os.path.abspath(file_path),
+            self.source_fingerprint(file_path),
+            self.normalize_parameters(parameters)
+        )
+
+    def get(self, key):
+        """
+        Look up a cached result.
+
+        Returns:
+            tuple: (found, result)
+        """
+        program = os.path.splitext(os.path.basename(key[0]))[0]
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry['stored_at'] > self.ttl_seconds:
+                del self._entries[key]
+                self._stats['expirations'] += 1
+                entry = None
+
+            if entry is None:
+                self._stats['misses'] += 1
+                return False, None
+
+            self._entries.move_to_end(key)
+            self._stats['hits'] += 1
+            self._hits_by_program[program] = self._hits_by_program.get(program, 0) + 1
+            result = entry['result']
+
+        try:
+            return True, copy.deepcopy(result)
+        except Exception:
+            return True, result
+
+    def put(self, key, result):
+        """Store a result, evicting the least recently used entries when full."""
+        try:
+            result = copy.deepcopy(result)
+        except Exception:
+            pass
+
+        with self._lock:
+            self._entries[key] = {'result': result, 'stored_at': time.monotonic()}
+            self._entries.move_to_end(key)
+            self._stats['stores'] += 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats['evictions'] += 1
+
+    def clear(self):
+        """Drop every cached result."""
+        with self._lock:
+            self._entries.clear()
+
+    def report(self):
+        """
+        Summarize cache effectiveness.
+
+        Returns:
+            dict: Counters, hit rate, current size and hits per program
+        """
+        with self._lock:
+            lookups = self._stats['hits'] + self._stats['misses']
+            return {
+                **self._stats,
+                'hit_rate': self._stats['hits'] / lookups if lookups else 0.0,
+                'size': len(self._entries),
+                'max_entries': self.max_entries,
+                'ttl_seconds': self.ttl_seconds,
+                'hits_by_program': dict(self._hits_by_program)
+            }
+
+
+# Process-wide cache shared by every session
+result_cache = ProgramResultCache()
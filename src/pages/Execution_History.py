@@ -0,0 +1,103 @@
+import time
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+
+from src.exec_tools.ExecutionHistoryStore import history_store
+
+
+WINDOWS = {
+    "Last hour": (3600, 300),
+    "Last 24 hours": (24 * 3600, 3600),
+    "Last 7 days": (7 * 24 * 3600, 6 * 3600),
+    "Last 30 days": (30 * 24 * 3600, 24 * 3600)
+}
+
+# Each UI execution records both an agent run and the program run its tool made
+SOURCES = {
+    "Program runs": "direct",
+    "Agent (CrewAI) runs, including LLM time": "crew"
+}
+
+
+def run_history_page():
+    st.set_page_config(layout="wide", page_title="Execution History")
+
+    st.title("📈 Execution History")
+
+    filter_col1, filter_col2, filter_col3 = st.columns([1, 1, 1])
+    with filter_col1:
+        window_name = st.selectbox("Time window", options=list(WINDOWS), index=1)
+    with filter_col2:
+        source_name = st.selectbox("Runs", options=list(SOURCES))
+    with filter_col3:
+        include_cached = st.checkbox(
+            "Include result-cache hits",
+            value=False,
+            help="Cache hits return in microseconds; by default they are only counted, not included in latency"
+        )
+
+    window_seconds, bucket_seconds = WINDOWS[window_name]
+    source = SOURCES[source_name]
+    since = time.time() - window_seconds
+
+    # Make sure runs queued by the background writer are visible
+    history_store.flush()
+
+    summary = history_store.program_summary(since, source=source, include_cached=include_cached)
+    if not summary:
+        st.info("No executions recorded in this time window.")
+        return
+
+    # Per-program latency, failure rate and throughput
+    st.header("Per-Program Latency")
+    summary_frame = pd.DataFrame(summary).rename(columns={
+        'program': 'Program',
+        'runs': 'Runs',
+        'cache_hits': 'Cache Hits',
+        'failures': 'Failures',
+        'failure_rate': 'Failure Rate',
+        'p50_ms': 'p50 (ms)',
+        'p95_ms': 'p95 (ms)',
+        'p99_ms': 'p99 (ms)',
+        'throughput_per_hour': 'Runs / Hour'
+    })
+    st.dataframe(
+        summary_frame.style.format({
+            'Failure Rate': '{:.1%}',
+            'p50 (ms)': '{:.1f}',
+            'p95 (ms)': '{:.1f}',
+            'p99 (ms)': '{:.1f}',
+            'Runs / Hour': '{:.2f}'
+        }, na_rep='-'),
+        use_container_width=True
+    )
+
+    # Trends over time
+    timeseries = pd.DataFrame(history_store.program_timeseries(
+        since, bucket_seconds=bucket_seconds, source=source, include_cached=include_cached
+    ))
+    timeseries['time'] = timeseries['bucket_start'].map(datetime.fromtimestamp)
+
+    programs = sorted(timeseries['program'].unique())
+    selected_programs = st.multiselect("Programs", options=programs, default=programs[:5])
+    if selected_programs:
+        timeseries = timeseries[timeseries['program'].isin(selected_programs)]
+
+    percentile = st.radio("Latency percentile", options=['p50_ms', 'p95_ms', 'p99_ms'], index=1, horizontal=True,
+                          format_func=lambda name: name.split('_')[0])
+
+    st.header("Latency Over Time (ms)")
+    st.line_chart(timeseries.pivot(index='time', columns='program', values=percentile))
+
+    chart_col1, chart_col2 = st.columns([1, 1])
+    with chart_col1:
+        st.header("Failure Rate")
+        st.line_chart(timeseries.pivot(index='time', columns='program', values='failure_rate'))
+    with chart_col2:
+        st.header("Throughput (runs per bucket)")
+        st.bar_chart(timeseries.pivot(index='time', columns='program', values='runs'))
+
+
+run_history_page()
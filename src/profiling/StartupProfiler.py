@@ -0,0 +1,131 @@
+import builtins
+import importlib.util
+import os
+import sys
+import threading
+import time
+
+
+class StartupProfiler:
+    """
+    Measure application startup: import time per module and time to first paint.
+
+    Profiling is enabled with the STARTUP_PROFILE environment variable. When
+    enabled, builtins.__import__ is wrapped during the first script run, until
+    first paint, so every first-time import records its self time (excluding
+    nested imports) and cumulative time, similar to ``python -X importtime``.
+    The hook is then removed and the report printed once.
+    """
+
+    def __init__(self):
+        self.enabled = os.getenv('STARTUP_PROFILE', '').strip().lower() in ('1', 'true', 'yes')
+        self.run_started_at = None
+        self.first_paint_ms = None
+        self.startup_first_paint_ms = None
+        self.imports = {}
+        self._original_import = None
+        self._startup_done = False
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def start(self):
+        """
+        Mark the start of a script run and, on the first run, install the import
+        hook if profiling is enabled. Safe to call on every Streamlit rerun.
+        """
+        self.run_started_at = time.perf_counter()
+        self.first_paint_ms = None
+        if self.enabled and not self._startup_done and self._original_import is None:
+            self._original_import = builtins.__import__
+            builtins.__import__ = self._timed_import
+
+    def mark_first_paint(self):
+        """
+        Record the time from the start of the run until the first UI element was sent.
+
+        On the first run this also ends startup profiling: the import hook is
+        removed and, if profiling is enabled, the report is printed.
+
+        Returns:
+            float: Elapsed milliseconds, or None if start() was not called
+        """
+        if self.run_started_at is None:
+            return None
+        self.first_paint_ms = (time.perf_counter() - self.run_started_at) * 1000
+
+        if not self._startup_done:
+            self._startup_done = True
+            self.startup_first_paint_ms = self.first_paint_ms
+            self._uninstall()
+            if self.enabled:
+                self.print_report()
+        return self.first_paint_ms
+
+    def _uninstall(self):
+        """Restore the original __import__, unless someone else has wrapped it since."""
+        if self._original_import is not None and builtins.__import__ == self._timed_import:
+            builtins.__import__ = self._original_import
+        self._original_import = None
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        """Wrapper around __import__ that times modules imported for the first time."""
+        try:
+            module_name = importlib.util.resolve_name('.' * level + name, (globals or {}).get('__package__')) if level else name
+        except (ImportError, ValueError):
+            module_name = name
+
+        if module_name in sys.modules:
+            return self._original_import(name, globals, locals, fromlist, level)
+
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+
+        frame = {'children': 0.0}
+        stack.append(frame)
+        started_at = time.perf_counter()
+        try:
+            return self._original_import(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - started_at
+            stack.pop()
+            if stack:
+                stack[-1]['children'] += elapsed
+            with self._lock:
+                self.imports[module_name] = {
+                    'module': module_name,
+                    'self_ms': (elapsed - frame['children']) * 1000,
+                    'cumulative_ms': elapsed * 1000
+                }
+
+    def report(self, limit=30):
+        """
+        Summarize the startup profile.
+
+        Args:
+            limit (int, optional): Number of slowest imports to include
+
+        Returns:
+            dict: Time to first paint of the first and the current run, and the
+            slowest startup imports by cumulative time
+        """
+        with self._lock:
+            imports = sorted(self.imports.values(), key=lambda item: item['cumulative_ms'], reverse=True)
+        return {
+            'startup_first_paint_ms': self.startup_first_paint_ms,
+            'first_paint_ms': self.first_paint_ms,
+            'imports': imports[:limit]
+        }
+
+    def print_report(self, limit=30):
+        """Print the startup profile to the console."""
+        report = self.report(limit)
+        if report['startup_first_paint_ms'] is not None:
+            print(f"Time to first paint: {report['startup_first_paint_ms']:.1f} ms")
+        print(f"{'cumulative ms':>14} {'self ms':>10}  module")
+        for item in report['imports']:
+            print(f"{item['cumulative_ms']:>14.1f} {item['self_ms']:>10.1f}  {item['module']}")
+
+
+# Process-wide profiler shared by every Streamlit rerun
+startup_profiler = StartupProfiler()
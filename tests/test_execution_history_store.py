@@ -0,0 +1,125 @@
+import time
+
+import pytest
+
+from src.exec_tools.ExecutionHistoryStore import ExecutionHistoryStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ExecutionHistoryStore(db_path=str(tmp_path / 'history.db'), flush_interval=0.01)
+
+
+def record(store, program, total_ms, source='direct', status='success', cached=False):
+    store.record(program=program, source=source, started_at=time.time(), total_ms=total_ms,
+                 status=status, cached=cached, result={'ok': True})
+
+
+def test_summary_only_counts_the_requested_source(store):
+    # One UI execution: the agent run and the program run its tool made
+    record(store, 'report', 2500.0, source='crew')
+    record(store, 'report', 40.0)
+    assert store.flush()
+
+    since = time.time() - 60
+    [direct] = store.program_summary(since)
+    [crew] = store.program_summary(since, source='crew')
+
+    assert direct['runs'] == 1 and direct['p50_ms'] == 40.0
+    assert crew['runs'] == 1 and crew['p50_ms'] == 2500.0
+
+
+def test_cache_hits_are_counted_but_kept_out_of_latency(store):
+    record(store, 'report', 100.0)
+    record(store, 'report', 200.0, status='error')
+    for _ in range(8):
+        record(store, 'report', 0.01, cached=True)
+    assert store.flush()
+
+    since = time.time() - 60
+    [summary] = store.program_summary(since)
+    assert summary['runs'] == 2
+    assert summary['cache_hits'] == 8
+    assert summary['failure_rate'] == 0.5
+    assert summary['p50_ms'] == 100.0
+
+    [with_cached] = store.program_summary(since, include_cached=True)
+    assert with_cached['runs'] == 10
+    assert with_cached['p50_ms'] == 0.01
+
+    buckets = store.program_timeseries(since, bucket_seconds=3600)
+    assert sum(bucket['runs'] for bucket in buckets) == 2
+    assert sum(bucket['cache_hits'] for bucket in buckets) == 8
+
+
+def test_program_with_only_cache_hits_has_no_latency(store):
+    record(store, 'report', 0.01, cached=True)
+    assert store.flush()
+
+    [summary] = store.program_summary(time.time() - 60)
+    assert summary['runs'] == 0
+    assert summary['cache_hits'] == 1
+    assert summary['p95_ms'] is None
+
+
+class Unserializable:
+    def __str__(self):
+        raise RuntimeError("cannot render")
+
+    __repr__ = __str__
+
+
+def fetch_rows(store):
+    connection = store._connect()
+    try:
+        return connection.execute("SELECT program, parameters_hash, result_size FROM executions ORDER BY id").fetchall()
+    finally:
+        connection.close()
+
+
+def test_unserializable_result_and_parameters_are_still_recorded(store):
+    store.record(program='broken', source='direct', started_at=time.time(), total_ms=1.0, status='success',
+                 parameters={'value': Unserializable()}, result=Unserializable())
+    for index in range(5):
+        record(store, f'program_{index}', 10.0)
+    assert store.flush()
+
+    rows = fetch_rows(store)
+    assert [row[0] for row in rows] == ['broken'] + [f'program_{index}' for index in range(5)]
+    assert rows[0][1] is None and rows[0][2] is None
+    assert all(row[2] for row in rows[1:])
+
+
+def test_result_is_snapshotted_when_recorded(store):
+    result = {'items': []}
+    store.record(program='report', source='direct', started_at=time.time(), total_ms=1.0, status='success',
+                 result=result)
+    result['items'] = list(range(1000))
+    assert store.flush()
+
+    assert fetch_rows(store)[0][2] == len('{"items": []}')
+
+
+def test_record_stays_cheap_for_large_results(store):
+    result = [{'id': index, 'name': f'row {index}', 'score': index * 0.5} for index in range(300_000)]
+    parameters = {'rows': list(range(100_000))}
+
+    started = time.perf_counter()
+    store.record(program='export', source='direct', started_at=time.time(), total_ms=1.0, status='success',
+                 parameters=parameters, result=result)
+    record_ms = (time.perf_counter() - started) * 1000
+
+    # Serializing this result takes hundreds of milliseconds; copying the list takes a few
+    assert record_ms < 50
+    assert store.flush(timeout=30)
+    assert fetch_rows(store)[0][2] > 1_000_000
+
+
+def test_failing_row_does_not_drop_the_rest_of_the_batch(store):
+    record(store, 'before', 10.0)
+    # Violates the NOT NULL constraint on program
+    record(store, None, 10.0)
+    record(store, 'after', 10.0)
+    assert store.flush()
+
+    assert [row[0] for row in fetch_rows(store)] == ['before', 'after']
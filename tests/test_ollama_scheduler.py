@@ -0,0 +1,148 @@
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+# Use LiteLLM's bundled model cost map instead of fetching it
+os.environ.setdefault('LITELLM_LOCAL_MODEL_COST_MAP', 'True')
+pytest.importorskip('litellm')
+
+from src.agents.ollama.OllamaScheduler import OllamaScheduler  # noqa: E402
+
+
+class FakeOllama:
+    """Minimal stand-in for the Ollama chat API that records every request."""
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.requests = []
+        self.active = 0
+        self.max_active = 0
+        self.release = threading.Event()
+        self.release.set()
+        self._lock = threading.Lock()
+
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+                with fake._lock:
+                    fake.requests.append((self.path, body))
+                    fake.active += 1
+                    fake.max_active = max(fake.max_active, fake.active)
+                fake.release.wait(5)
+                time.sleep(fake.delay)
+                with fake._lock:
+                    fake.active -= 1
+
+                payload = json.dumps({
+                    'model': body['model'],
+                    'created_at': '2024-01-01T00:00:00Z',
+                    'message': {'role': 'assistant', 'content': f"reply to {body['messages'][-1]['content']}"},
+                    'done': True,
+                    'prompt_eval_count': 1,
+                    'eval_count': 1
+                }).encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def prompts(self):
+        return [body['messages'][-1]['content'] for _, body in self.requests]
+
+
+@pytest.fixture
+def ollama():
+    fake = FakeOllama()
+    yield fake
+    fake.release.set()
+    fake.server.shutdown()
+
+
+@pytest.fixture
+def scheduler_env(monkeypatch):
+    monkeypatch.setenv('OLLAMA_NUM_CTX', '8192')
+    monkeypatch.setenv('OLLAMA_KEEP_ALIVE', '45m')
+
+
+def run_in_threads(calls):
+    threads = [threading.Thread(target=call) for call in calls]
+    for thread in threads:
+        thread.start()
+    return threads
+
+
+def test_request_body_carries_fixed_num_ctx_and_keep_alive(ollama, scheduler_env):
+    scheduler = OllamaScheduler(max_concurrent=1)
+
+    reply = scheduler.complete("short", model='ollama/big', api_base=ollama.url, temperature=0.2)
+    scheduler.complete("long " * 5000, model='ollama/big', api_base=ollama.url)
+
+    assert reply == "reply to short"
+    (path, short), (_, long) = ollama.requests
+    assert path == '/api/chat'
+    assert short['keep_alive'] == long['keep_alive'] == '45m'
+    assert short['model'] == long['model'] == 'big'
+    # Every call gets the same context window, whatever the prompt length
+    assert short['options']['num_ctx'] == long['options']['num_ctx'] == 8192
+    assert scheduler.report()['calls_by_model'] == {'ollama/big': 2}
+
+
+def test_concurrency_is_capped(ollama, scheduler_env):
+    scheduler = OllamaScheduler(max_concurrent=2)
+
+    threads = run_in_threads([
+        lambda index=index: scheduler.complete(f"call {index}", model='ollama/big', api_base=ollama.url)
+        for index in range(6)
+    ])
+    for thread in threads:
+        thread.join(10)
+
+    assert len(ollama.requests) == 6
+    assert ollama.max_active == 2
+    assert scheduler.report()['completed'] == 6
+
+
+def test_waiting_calls_are_served_in_arrival_order(ollama, scheduler_env):
+    scheduler = OllamaScheduler(max_concurrent=1)
+    ollama.release.clear()
+
+    # Occupy the only slot, then queue calls behind it one at a time
+    threads = run_in_threads([lambda: scheduler.complete("first", model='ollama/big', api_base=ollama.url)])
+    while not ollama.requests:
+        time.sleep(0.01)
+    for index, prompt in enumerate(["second", "third", "fourth"], start=1):
+        threads += run_in_threads([lambda prompt=prompt: scheduler.complete(prompt, model='ollama/big', api_base=ollama.url)])
+        while scheduler.report()['waiting'] < index:
+            time.sleep(0.01)
+
+    ollama.release.set()
+    for thread in threads:
+        thread.join(10)
+
+    assert ollama.prompts() == ["first", "second", "third", "fourth"]
+    assert ollama.max_active == 1
+
+
+def test_queue_timeout(scheduler_env):
+    scheduler = OllamaScheduler(max_concurrent=1, queue_timeout=0.05)
+
+    with scheduler.slot():
+        with pytest.raises(TimeoutError):
+            with scheduler.slot():
+                pass
+
+    assert scheduler.report()['timed_out'] == 1
@@ -0,0 +1,194 @@
+import logging
+import pickle
+import sys
+import textwrap
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.exec_tools.ProgramDiscoveryTools import ProgramDiscoveryTools
+from src.exec_tools.ProgramExecutionTools import ProgramExecutionTools
+from src.exec_tools.ProgramLoader import ProgramLoader
+
+
+def write(path, source):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(textwrap.dedent(source))
+    return str(path)
+
+
+@pytest.fixture
+def global_state():
+    """Snapshot sys.path and the non-namespace entries of sys.modules."""
+    def snapshot():
+        return list(sys.path), {name for name in sys.modules if not name.startswith('_program_')}
+    return snapshot
+
+
+def test_concurrent_runs_keep_local_modules_apart(tmp_path, global_state):
+    programs = []
+    for name in ('first', 'second'):
+        write(tmp_path / name / 'helper.py', f"NAME = {name!r}\n")
+        programs.append(write(tmp_path / name / 'program.py', """
+            import time
+            import helper
+
+            def execute(index):
+                time.sleep(0.01)
+                import helper as again
+                return helper.NAME, again.NAME, index
+        """))
+
+    before = global_state()
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [
+            executor.submit(ProgramExecutionTools.execute_program, programs[index % 2], {'index': index}, False)
+            for index in range(40)
+        ]
+        results = [future.result() for future in futures]
+
+    for index, (success, result) in enumerate(results):
+        name = ('first', 'second')[index % 2]
+        assert success and result == (name, name, index)
+    assert global_state() == before
+    assert 'helper' not in sys.modules
+
+
+def test_dataclass_with_postponed_annotations_in_helper(tmp_path):
+    write(tmp_path / 'shapes.py', """
+        from __future__ import annotations
+        import dataclasses
+        from typing import ClassVar
+
+        @dataclasses.dataclass
+        class Point:
+            x: int
+            y: int
+            dimensions: ClassVar[int] = 2
+    """)
+    program = write(tmp_path / 'program.py', """
+        from shapes import Point
+
+        def execute():
+            return Point(1, 2)
+    """)
+
+    success, result = ProgramExecutionTools.execute_program(program, use_cache=False)
+
+    assert success, result
+    assert (result.x, result.y, type(result).dimensions) == (1, 2, 2)
+
+
+def test_helper_classes_can_be_pickled(tmp_path):
+    write(tmp_path / 'helper2.py', """
+        class Record:
+            def __init__(self, value):
+                self.value = value
+    """)
+    program = write(tmp_path / 'program.py', """
+        import pickle
+        from helper2 import Record
+
+        def execute():
+            return pickle.loads(pickle.dumps(Record(5))).value, Record(7)
+    """)
+
+    success, result = ProgramExecutionTools.execute_program(program, use_cache=False)
+
+    assert success, result
+    assert result[0] == 5
+    # The latest run stays registered, so its results remain picklable
+    assert pickle.loads(pickle.dumps(result[1])).value == 7
+
+
+def test_relative_imports_inside_local_packages(tmp_path):
+    write(tmp_path / 'pkg' / '__init__.py', "from .sub import VALUE\n")
+    write(tmp_path / 'pkg' / 'sub.py', "from . import constants\nVALUE = constants.BASE + 1\n")
+    write(tmp_path / 'pkg' / 'constants.py', "BASE = 41\n")
+    write(tmp_path / 'sibling.py', "NAME = 'sibling'\n")
+    program = write(tmp_path / 'program.py', """
+        import pkg.sub
+        from pkg import constants
+        from . import sibling
+
+        def execute():
+            return pkg.VALUE, pkg.sub.VALUE, constants.BASE, sibling.NAME
+    """)
+
+    assert ProgramExecutionTools.execute_program(program, use_cache=False) == (True, (42, 42, 41, 'sibling'))
+
+
+def test_missing_local_submodule_raises(tmp_path):
+    write(tmp_path / 'pkg' / '__init__.py', "")
+    program = write(tmp_path / 'program.py', """
+        import pkg.missing
+
+        def execute():
+            return None
+    """)
+
+    success, result = ProgramExecutionTools.execute_program(program, use_cache=False)
+
+    assert not success
+    assert "No module named 'pkg.missing'" in result['error_message']
+
+
+def test_release_keeps_only_the_latest_run(tmp_path):
+    write(tmp_path / 'helper.py', "VALUE = 1\n")
+    program = write(tmp_path / 'program.py', "import helper\n")
+
+    first, second = ProgramLoader(program), ProgramLoader(program)
+    first.load()
+    second.load()
+    first.release()
+    second.release()
+
+    # Both runs share the namespace name; unloading the first leaves the second's modules
+    assert first.namespace == second.namespace
+    assert sys.modules[f"{second.namespace}.helper"] is second.modules['helper']
+    assert first.modules['helper'] is not second.modules['helper']
+    second.unload()
+    assert second.namespace not in sys.modules
+    assert f"{second.namespace}.helper" not in sys.modules
+
+
+def test_module_names_are_stable_across_runs(tmp_path):
+    write(tmp_path / 'helper.py', """
+        import logging
+        logger = logging.getLogger(__name__)
+    """)
+    program = write(tmp_path / 'program.py', """
+        import logging
+        import helper
+
+        logger = logging.getLogger(__name__)
+
+        def execute():
+            return __name__, helper.__name__
+    """)
+
+    success, names = ProgramExecutionTools.execute_program(program, use_cache=False)
+    assert success, names
+    loggers_before = len(logging.Logger.manager.loggerDict)
+
+    for _ in range(20):
+        assert ProgramExecutionTools.execute_program(program, use_cache=False) == (True, names)
+
+    assert len(logging.Logger.manager.loggerDict) == loggers_before
+    assert names == (f"{ProgramLoader.namespace_for(program)}.program", f"{ProgramLoader.namespace_for(program)}.helper")
+
+
+def test_inspection_does_not_leave_modules_behind(tmp_path):
+    write(tmp_path / 'helper.py', "VALUE = 1\n")
+    program = write(tmp_path / 'program.py', """
+        import helper
+
+        def execute(name, times):
+            return name * times
+    """)
+    before = set(sys.modules)
+
+    details = ProgramDiscoveryTools.inspect_program(program)
+
+    assert details == {'name': 'program', 'path': program, 'parameters': ['name', 'times']}
+    assert set(sys.modules) == before
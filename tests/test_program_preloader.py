@@ -0,0 +1,92 @@
+import sys
+import textwrap
+import time
+
+import pytest
+
+from src.exec_tools import ProgramExecutionTools as execution_module
+from src.exec_tools.ProgramExecutionTools import ProgramExecutionTools
+from src.exec_tools.ProgramPreloader import ProgramPreloader
+
+
+@pytest.fixture
+def preloader(monkeypatch):
+    preloader = ProgramPreloader(max_concurrent=2, ttl_seconds=60)
+    monkeypatch.setattr(execution_module, 'program_preloader', preloader)
+    return preloader
+
+
+@pytest.fixture
+def program(tmp_path):
+    path = tmp_path / 'program.py'
+    path.write_text(textwrap.dedent("""
+        import time
+        LOADED_AT = time.time()
+
+        def execute():
+            return LOADED_AT
+    """))
+    return str(path)
+
+
+def wait_until_loaded(preloader, owner):
+    preloader._preloads[owner]['future'].result(timeout=5)
+
+
+def test_owner_claims_its_preload(preloader, program):
+    preloader.preload('session-a', program)
+    wait_until_loaded(preloader, 'session-a')
+    loaded_at = preloader._preloads['session-a']['future'].result().modules['program'].LOADED_AT
+
+    assert ProgramExecutionTools.execute_program(program, use_cache=False, preload_owner='session-a') == (True, loaded_at)
+    assert preloader.report()['used'] == 1
+
+
+def test_other_callers_cannot_take_a_sessions_preload(preloader, program):
+    preloader.preload('session-a', program)
+    wait_until_loaded(preloader, 'session-a')
+
+    ProgramExecutionTools.execute_program(program, use_cache=False)
+    ProgramExecutionTools.execute_program(program, use_cache=False, preload_owner='session-b')
+
+    report = preloader.report()
+    assert (report['used'], report['pending']) == (0, 1)
+    assert preloader.take('session-b', program) is None
+    assert preloader.take('session-a', program) is not None
+
+
+def test_changing_selection_discards_and_unloads_the_preload(preloader, program, tmp_path):
+    other = tmp_path / 'other.py'
+    other.write_text("def execute():\n    return 'other'\n")
+
+    preloader.preload('session-a', program)
+    wait_until_loaded(preloader, 'session-a')
+    namespace = preloader._preloads['session-a']['future'].result().namespace
+    preloader.preload('session-a', str(other))
+
+    assert namespace not in sys.modules
+    assert preloader.take('session-a', program) is None
+    assert preloader.report()['discarded'] == 1
+
+
+def test_unrefreshed_preloads_expire(program):
+    preloader = ProgramPreloader(max_concurrent=1, ttl_seconds=0.05)
+    preloader.preload('ended-session', program)
+    wait_until_loaded(preloader, 'ended-session')
+    namespace = preloader._preloads['ended-session']['future'].result().namespace
+
+    time.sleep(0.1)
+    report = preloader.report()
+
+    assert (report['expired'], report['pending']) == (1, 0)
+    assert namespace not in sys.modules
+
+
+def test_edited_program_is_not_used(preloader, program):
+    preloader.preload('session-a', program)
+    wait_until_loaded(preloader, 'session-a')
+    with open(program, 'a') as source_file:
+        source_file.write("\nEDITED = True\n")
+
+    assert preloader.take('session-a', program) is None
+    assert preloader.report()['stale'] == 1
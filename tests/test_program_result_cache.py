@@ -0,0 +1,106 @@
+import textwrap
+
+import pytest
+
+from src.exec_tools import ProgramExecutionTools as execution_module
+from src.exec_tools.ProgramExecutionTools import ProgramExecutionTools
+from src.exec_tools.ProgramResultCache import ProgramResultCache
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = ProgramResultCache(max_entries=2, ttl_seconds=60)
+    monkeypatch.setattr(execution_module, 'result_cache', cache)
+    return cache
+
+
+def write(path, source):
+    path.write_text(textwrap.dedent(source))
+    return str(path)
+
+
+CACHEABLE_PROGRAM = """
+    import helper
+    CACHEABLE = True
+
+    def execute(value):
+        helper.CALLS.append(value)
+        return {'value': value, 'calls': len(helper.CALLS), 'tag': helper.TAG}
+"""
+
+
+def test_cacheable_program_is_served_from_cache(tmp_path, cache):
+    write(tmp_path / 'helper.py', "CALLS = []\nTAG = 'one'\n")
+    program = write(tmp_path / 'program.py', CACHEABLE_PROGRAM)
+
+    first = ProgramExecutionTools.execute_program(program, {'value': 'a'})
+    second = ProgramExecutionTools.execute_program(program, {'value': 'a'})
+
+    assert first == second == (True, {'value': 'a', 'calls': 1, 'tag': 'one'})
+    report = cache.report()
+    assert (report['hits'], report['misses'], report['stores']) == (1, 1, 1)
+    assert report['hits_by_program'] == {'program': 1}
+
+
+def test_editing_a_local_import_invalidates_the_entry(tmp_path, cache):
+    helper = tmp_path / 'helper.py'
+    write(helper, "CALLS = []\nTAG = 'one'\n")
+    program = write(tmp_path / 'program.py', CACHEABLE_PROGRAM)
+
+    ProgramExecutionTools.execute_program(program, {'value': 'a'})
+    write(helper, "CALLS = []\nTAG = 'two'\n")
+
+    assert ProgramExecutionTools.execute_program(program, {'value': 'a'})[1]['tag'] == 'two'
+    assert cache.report()['hits'] == 0
+
+
+def test_bypass_runs_the_program(tmp_path, cache):
+    write(tmp_path / 'helper.py', "CALLS = []\nTAG = 'one'\n")
+    program = write(tmp_path / 'program.py', CACHEABLE_PROGRAM)
+
+    ProgramExecutionTools.execute_program(program, {'value': 'a'})
+    ProgramExecutionTools.execute_program(program, {'value': 'a'}, use_cache=False)
+
+    assert cache.report()['hits'] == 0
+
+
+def test_programs_without_marker_skip_the_cache(tmp_path, cache):
+    program = write(tmp_path / 'program.py', """
+        def execute():
+            return 'fresh'
+    """)
+
+    for _ in range(3):
+        assert ProgramExecutionTools.execute_program(program) == (True, 'fresh')
+
+    report = cache.report()
+    assert (report['hits'], report['misses'], report['stores']) == (0, 0, 0)
+
+
+@pytest.mark.parametrize('marker, expected', [
+    ("CACHEABLE = True", True),
+    ("CACHEABLE = False", False),
+    ("CACHEABLE = 1", False),
+    ("def execute():\n    CACHEABLE = True", False),
+])
+def test_marker_is_detected_statically(tmp_path, marker, expected):
+    program = write(tmp_path / 'program.py', marker + "\n")
+    assert ProgramResultCache.is_marked_cacheable(program) is expected
+
+
+def test_least_recently_used_entries_are_evicted():
+    cache = ProgramResultCache(max_entries=2, ttl_seconds=60)
+    for key in ('a', 'b', 'c'):
+        cache.put(key, key)
+
+    assert cache.get('a') == (False, None)
+    assert cache.get('c') == (True, 'c')
+    assert cache.report()['evictions'] == 1
+
+
+def test_expired_entries_are_dropped():
+    cache = ProgramResultCache(max_entries=2, ttl_seconds=0)
+    cache.put('a', 'a')
+
+    assert cache.get('a') == (False, None)
+    assert cache.report()['expirations'] == 1
@@ -0,0 +1,40 @@
+import builtins
+import sys
+
+from src.profiling.StartupProfiler import StartupProfiler
+
+
+def test_hook_times_startup_imports_and_is_removed_after_first_paint(monkeypatch, capsys):
+    monkeypatch.setenv('STARTUP_PROFILE', '1')
+    monkeypatch.delitem(sys.modules, 'colorsys', raising=False)
+    original_import = builtins.__import__
+    profiler = StartupProfiler()
+
+    profiler.start()
+    assert builtins.__import__ != original_import
+    import colorsys  # noqa: F401
+    profiler.mark_first_paint()
+
+    assert builtins.__import__ is original_import
+    report = profiler.report()
+    assert report['startup_first_paint_ms'] is not None
+    assert 'colorsys' in [item['module'] for item in report['imports']]
+    assert 'Time to first paint' in capsys.readouterr().out
+
+    # Later reruns neither reinstall the hook nor print again
+    profiler.start()
+    assert builtins.__import__ is original_import
+    profiler.mark_first_paint()
+    assert capsys.readouterr().out == ''
+
+
+def test_disabled_profiler_only_measures_first_paint(monkeypatch, capsys):
+    monkeypatch.delenv('STARTUP_PROFILE', raising=False)
+    original_import = builtins.__import__
+    profiler = StartupProfiler()
+
+    profiler.start()
+    assert builtins.__import__ is original_import
+    assert profiler.mark_first_paint() is not None
+    assert profiler.report()['imports'] == []
+    assert capsys.readouterr().out == ''